@@ -1,13 +1,64 @@
 import csv
+import datetime
+import os
 import struct
 import time
-import matplotlib.pyplot as plt
+from concurrent.futures import ThreadPoolExecutor
+
+
+def encode_varint(n: int) -> bytes:
+    """
+    Codifica un entero no negativo en base 128 (LEB128)
+    """
+    out = bytearray()
+    while n > 0x7f:
+        out.append((n & 0x7f) | 0x80)
+        n >>= 7
+    out.append(n)
+    return bytes(out)
+
+def decode_varint(data: bytes, i: int = 0) -> (int, int):
+    """
+    Decodifica un varint desde data[i:], retorna (valor, siguiente indice)
+    """
+    n = 0
+    shift = 0
+    while True:
+        b = data[i]
+        i += 1
+        n |= (b & 0x7f) << shift
+        if b < 0x80:
+            return n, i
+        shift += 7
+
+def encode_fecha(fecha: str) -> bytes:
+    """
+    Fechas validas 'YYYY-MM-DD' se guardan como nro de dia (bit 0 = 0),
+    cualquier otro texto se guarda tal cual con su longitud (bit 0 = 1)
+    """
+    try:
+        dia = datetime.date.fromisoformat(fecha)
+        if dia.isoformat() == fecha:
+            return encode_varint(dia.toordinal() << 1)
+    except ValueError:
+        pass
+    raw = fecha.encode()
+    return encode_varint((len(raw) << 1) | 1) + raw
+
+def decode_fecha(data: bytes, i: int) -> (str, int):
+    tag, i = decode_varint(data, i)
+    if tag & 1 == 0:
+        return datetime.date.fromordinal(tag >> 1).isoformat(), i
+    n = tag >> 1
+    return data[i:i + n].decode(), i + n
 
 
 class Venta:
-    FORMAT = 'i30sif10siii'
+    # indice: id_venta, der, izq, height, offset del payload en el heap
+    FORMAT = 'iiiii'
     STRUCT = struct.Struct(FORMAT)
     RECORD_SIZE = struct.calcsize(FORMAT)
+    PRECIO = struct.Struct('<f')
 
     def __init__(self,
                  id_venta : int = -1,
@@ -17,7 +68,8 @@ class Venta:
                  fecha: str = "",
                  der:int = -1,
                  izq:int = -1,
-                 height = 0):
+                 height = 0,
+                 payload:int = -1):
         self.id_venta = id_venta
         self.nombre = nombre
         self.cant = cant
@@ -26,6 +78,7 @@ class Venta:
         self.der = der
         self.izq = izq
         self.height = height
+        self.payload = payload # offset en el heap, -1 si aun no se escribio
 
     def __str__(self):
         return str(self.__dict__)
@@ -33,48 +86,86 @@ class Venta:
     def unpack(self, data: bytes):
         l = self.STRUCT.unpack(data)
         self.id_venta = l[0]
-        self.nombre = l[1].decode().strip("\x00")
-        self.cant = l[2]
-        self.precio_u = round(l[3],2)
-        self.fecha = l[4].decode()
-        self.der = l[5]
-        self.izq = l[6]
-        self.height = l[7]
+        self.der = l[1]
+        self.izq = l[2]
+        self.height = l[3]
+        self.payload = l[4]
 
     def pack(self)-> bytes:
         return self.STRUCT.pack(self.id_venta,
-                               self.nombre.encode(),
-                               self.cant,
-                               self.precio_u,
-                               self.fecha.encode(),
-                               self.der,
-                               self.izq,
-                            self.height)
+                                self.der,
+                                self.izq,
+                                self.height,
+                                self.payload)
+
+    def pack_payload(self) -> bytes:
+        """
+        Serializa nombre, cant, precio_u y fecha con prefijo de longitud
+        """
+        nombre = self.nombre.encode()
+        cant = self.cant << 1 if self.cant >= 0 else ((-self.cant) << 1) - 1 # zigzag, admite negativos de cualquier tamaño
+        body = (encode_varint(len(nombre)) + nombre
+                + encode_varint(cant)
+                + self.PRECIO.pack(self.precio_u)
+                + encode_fecha(self.fecha))
+        return encode_varint(len(body)) + body
+
+    def unpack_payload(self, data: bytes, i: int = 0) -> int:
+        """
+        Lee un payload desde data[i:], retorna el indice siguiente
+        """
+        size, i = decode_varint(data, i)
+        end = i + size
+        n, i = decode_varint(data, i)
+        self.nombre = data[i:i + n].decode()
+        i += n
+        cant, i = decode_varint(data, i)
+        self.cant = (cant >> 1) ^ -(cant & 1)
+        self.precio_u = round(self.PRECIO.unpack_from(data, i)[0], 2)
+        i += self.PRECIO.size
+        self.fecha, i = decode_fecha(data, i)
+        return end
 
 class AVL_db:
-    HEADER_FORMAT = 'i'
+    # cabecera: formato del archivo y raiz; MAGIC cambia si cambia el layout del indice
+    MAGIC = b'AVL2'
+    HEADER_FORMAT = '4si'
     HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+    HEAP_READAHEAD = 64 # bytes leidos de una vez, alcanza para la mayoria de payloads
+    PREFETCH_GAP = 8 # huecos (en tuplas) que se leen de mas para unir dos lecturas en una
+    PREFETCH_WORKERS = 4 # lecturas dispersas en paralelo
+    PREFETCH_AHEAD = 4 # lotes mas chicos se leen directo, pasar por el pool cuesta mas que la lectura
     def __init__(self, name:str):
+        self.pool = None # pool de lecturas, se crea al primer prefetch
+        self.fds = {} # descriptores para os.pread, por archivo
         if name[-4:] == ".csv": # si es un csv
             self.name = name[:-4] + ".dat" # creamos a parte un archivo .dat
-            open(self.name, 'wb').close() # crea el archivo si no existe
+            self.heap = name[:-4] + ".heap" # y otro para los payloads
+            open(self.heap, 'wb').close()
             with open(self.name, 'wb') as file:
                 self.root = 0
-                header = struct.pack(self.HEADER_FORMAT, self.root) # cabecera
+                header = struct.pack(self.HEADER_FORMAT, self.MAGIC, self.root) # cabecera
                 file.write(header)
             self.open_csv(name)
 
         else:
             open(name, 'ab').close() # crea el archivo si no existe
             self.name = name
+            self.heap = os.path.splitext(name)[0] + ".heap"
             with open(self.name, 'rb+') as file:
                 header = file.read(self.HEADER_SIZE)
                 if not header:
                     self.root = 0
-                    header = struct.pack(self.HEADER_FORMAT, self.root) # escribimos la cabecera
+                    header = struct.pack(self.HEADER_FORMAT, self.MAGIC, self.root) # escribimos la cabecera
                     file.write(header)
+                    open(self.heap, 'ab').close()
                 else:
-                    self.root = struct.unpack(self.HEADER_FORMAT, header)[0] # leemos la cabecera
+                    if len(header) < self.HEADER_SIZE or header[:len(self.MAGIC)] != self.MAGIC:
+                        raise ValueError(f"{name} no tiene el formato {self.MAGIC.decode()} "
+                                         "(archivo de una version anterior?), vuelva a cargarlo desde el csv")
+                    if not os.path.exists(self.heap):
+                        raise FileNotFoundError(f"falta el archivo de payloads {self.heap}")
+                    self.root = struct.unpack(self.HEADER_FORMAT, header)[1] # leemos la cabecera
 
     def open_csv(self, name:str):
         """
@@ -87,7 +178,10 @@ class AVL_db:
                 data = Venta(int(row[0]),row[1],int(row[2]),float(row[3]),row[4]) # cada fila es una tupla
                 self.add(data) # lo añadimos a la bd
 
-    def get(self, pos:int)->Venta | None:
+    def get_node(self, pos:int)->Venta | None:
+        """
+        Lee solo la entrada del indice (clave, punteros, altura), sin el payload
+        """
         if pos < 0: # no acepta posiciones negativas
             return None
         with (open(self.name, 'rb') as file):
@@ -99,10 +193,167 @@ class AVL_db:
             tupla.unpack(data)
             return tupla
 
+    def get(self, pos:int)->Venta | None:
+        tupla = self.get_node(pos)
+        if tupla is not None:
+            self.load_payload(tupla)
+        return tupla
+
+    def load_payload(self, tupla:Venta):
+        """
+        Completa nombre, cant, precio_u y fecha leyendo el heap
+        """
+        if tupla.payload < 0: # tupla vacia o eliminada
+            return
+        with open(self.heap, 'rb') as file:
+            file.seek(tupla.payload)
+            data = file.read(self.HEAP_READAHEAD)
+            size, i = decode_varint(data)
+            if i + size > len(data): # el payload no entro en la primera lectura
+                data += file.read(i + size - len(data))
+            tupla.unpack_payload(data)
+
+    def post_payload(self, data: Venta) -> int:
+        """
+        Añade el payload de una tupla al heap
+        """
+        with open(self.heap, 'ab') as file:
+            data.payload = file.tell()
+            file.write(data.pack_payload())
+            return data.payload
+
+    def executor(self)->ThreadPoolExecutor:
+        """
+        Pool de lecturas, se crea la primera vez que se usa y se reutiliza
+        """
+        if self.pool is None:
+            self.pool = ThreadPoolExecutor(self.PREFETCH_WORKERS)
+        return self.pool
+
+    def descriptor(self, path:str)->int:
+        """
+        Descriptor de solo lectura para os.pread, abierto una vez por archivo
+        """
+        if path not in self.fds:
+            self.fds[path] = os.open(path, os.O_RDONLY)
+        return self.fds[path]
+
+    def close(self):
+        """
+        Libera el pool de lecturas y los descriptores abiertos
+        """
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+        for fd in self.fds.values():
+            os.close(fd)
+        self.fds = {}
+
+    def read_spans(self, path:str, spans:list, parallel:bool = True)->list:
+        """
+        Lee varios (offset, size) de un archivo; si son varios, en paralelo
+        parallel=False para llamadas que ya corren dentro del pool: esperar a
+        otras tareas del mismo pool desde un worker puede dejarlo sin hilos libres
+        """
+        if not spans:
+            return []
+        if not hasattr(os, 'pread'):
+            with open(path, 'rb') as file:
+                r = []
+                for offset, size in spans:
+                    file.seek(offset)
+                    r.append(file.read(size))
+                return r
+        fd = self.descriptor(path)
+        if len(spans) < self.PREFETCH_AHEAD or not parallel: # pocas corridas no vale la pena pasar por el pool
+            return [os.pread(fd, size, offset) for offset, size in spans]
+        return list(self.executor().map(lambda span: os.pread(fd, span[1], span[0]), spans))
+
+    def clusters(self, offsets:list, gap:int)->list:
+        """
+        Agrupa offsets ordenados en corridas cuya separacion no supera gap
+        """
+        runs = []
+        for off in sorted(set(offsets)):
+            if runs and off - runs[-1][-1] <= gap:
+                runs[-1].append(off)
+            else:
+                runs.append([off])
+        return runs
+
+    def get_many(self, positions:list, parallel:bool = True)->dict:
+        """
+        Lee varias entradas del indice, uniendo las que estan cerca
+        en una sola lectura secuencial
+        """
+        size = Venta.RECORD_SIZE
+        runs = self.clusters([p for p in positions if p >= 0], self.PREFETCH_GAP)
+        spans = [(self.HEADER_SIZE + run[0] * size, (run[-1] - run[0] + 1) * size) for run in runs]
+        r = {}
+        for run, data in zip(runs, self.read_spans(self.name, spans, parallel)):
+            for pos in run:
+                i = (pos - run[0]) * size
+                if i + size > len(data): # fuera del archivo
+                    break
+                tupla = Venta()
+                tupla.unpack(data[i:i + size])
+                r[pos] = tupla
+        return r
+
+    def load_payloads(self, tuplas:list):
+        """
+        Completa los payloads de varias tuplas con lecturas agrupadas del heap
+        """
+        tuplas = [t for t in tuplas if t.payload >= 0]
+        runs = self.clusters([t.payload for t in tuplas], self.PREFETCH_GAP * self.HEAP_READAHEAD)
+        spans = [(run[0], run[-1] - run[0] + self.HEAP_READAHEAD) for run in runs]
+        chunks = {}
+        for run, data in zip(runs, self.read_spans(self.heap, spans)):
+            for off in run:
+                chunks[off] = (data, off - run[0])
+        for tupla in tuplas:
+            data, i = chunks[tupla.payload]
+            try:
+                size, j = decode_varint(data, i)
+            except IndexError:
+                size, j = 0, len(data) + 1
+            if j + size > len(data): # el payload no entro en la lectura agrupada
+                self.load_payload(tupla)
+            else:
+                tupla.unpack_payload(data, i)
+
+    def prefetch(self, pos:int, children, wanted)->dict:
+        """
+        Recorre el arbol por niveles leyendo en bloque todos los nodos de la
+        siguiente frontera; children(nodo) indica que hijos visitar y
+        wanted(nodo) si hay que leer su payload. Mientras se leen los payloads
+        de un nivel, el siguiente nivel ya se esta leyendo en el pool
+        """
+        nodes = {}
+        batch = self.get_many([pos])
+        while batch:
+            nodes.update(batch)
+            frontier = [c for tupla in batch.values() for c in children(tupla)
+                        if c >= 0 and c not in nodes]
+            pendientes = [t for t in batch.values() if wanted(t)]
+            if not frontier:
+                self.load_payloads(pendientes)
+                break
+            if pendientes and len(frontier) >= self.PREFETCH_AHEAD:
+                siguiente = self.executor().submit(self.get_many, frontier, False)
+                self.load_payloads(pendientes)
+                batch = siguiente.result()
+            else:
+                self.load_payloads(pendientes)
+                batch = self.get_many(frontier)
+        return nodes
+
     def post(self, data: Venta) -> int:
         """
         Añade una tupla a la base de datos
         """
+        if data.payload == -1 and data.id_venta != -1:
+            self.post_payload(data)
         with open(self.name, 'ab') as file:
             pos = (file.tell() - self.HEADER_SIZE) // data.RECORD_SIZE # guardamos el nro de tupla que añadiremos
             file.write(data.pack())
@@ -112,6 +363,8 @@ class AVL_db:
         """
         Actualiza una tupla en la base de datos
         """
+        if data.payload == -1 and data.id_venta != -1:
+            self.post_payload(data)
         with open(self.name, 'rb+') as file:
             file.seek(self.HEADER_SIZE + (pos * data.RECORD_SIZE))
             file.write(data.pack())
@@ -122,7 +375,7 @@ class AVL_db:
         """
         self.root = root # en memoria ram
         with open(self.name, 'rb+') as file:
-            file.write(struct.pack('i', root)) # en memoria secundaria
+            file.write(struct.pack(self.HEADER_FORMAT, self.MAGIC, root)) # en memoria secundaria
 
     def seek(self, id_venta:int, pos:int):
         """
@@ -130,7 +383,7 @@ class AVL_db:
         """
         if pos == -1:
             return pos
-        punt = self.get(pos) # obtenemos la tupla y realizamos busqueda binaria
+        punt = self.get_node(pos) # obtenemos la tupla y realizamos busqueda binaria
         if punt is None:
             return -1
         if id_venta == punt.id_venta:
@@ -153,24 +406,28 @@ class AVL_db:
             now = self.get(ite)
         return r
 
-    def load_order(self)-> list:
+    def load_order(self, prefetch:bool = False)-> list:
         """
         Carga todas las tuplas de la base de datos en orden
+        prefetch: lee el arbol por niveles en bloque antes de recorrerlo
         """
         ret = []
-        self.load_aux(self.root, ret)
+        nodes = None
+        if prefetch:
+            nodes = self.prefetch(self.root, lambda n: (n.izq, n.der), lambda n: True)
+        self.load_aux(self.root, ret, nodes)
         return ret
 
-    def load_aux(self, pos:int, ret:list):
+    def load_aux(self, pos:int, ret:list, nodes:dict = None):
         """
         in-order search
         """
-        punt = self.get(pos)
+        punt = self.get(pos) if nodes is None else nodes.get(pos)
         if punt is None:
             return
-        self.load_aux(punt.izq, ret)
+        self.load_aux(punt.izq, ret, nodes)
         ret.append(punt)
-        self.load_aux(punt.der, ret)
+        self.load_aux(punt.der, ret, nodes)
 
 
     def update_height(self, nodo: Venta) -> int:
@@ -179,15 +436,15 @@ class AVL_db:
         if nodo.izq == -1 and nodo.der == -1:
             return 0
         else:
-            d_h = 0 if nodo.der == -1 else self.get(nodo.der).height # si tiene nodo derecho, tomamos su altura
-            i_h = 0 if nodo.izq == -1 else self.get(nodo.izq).height # si tiene nodo izquierdo, tomamos su altura
+            d_h = 0 if nodo.der == -1 else self.get_node(nodo.der).height # si tiene nodo derecho, tomamos su altura
+            i_h = 0 if nodo.izq == -1 else self.get_node(nodo.izq).height # si tiene nodo izquierdo, tomamos su altura
             return max(d_h,i_h) + 1
 
     def get_balance(self, nodo: Venta) -> int:
         if not nodo:
             return 0
-        d = 0 if nodo.der == -1 else 1 + self.get(nodo.der).height # si tiene nodo derecho, tomamos su altura + 1
-        i = 0 if nodo.izq == -1 else 1 + self.get(nodo.izq).height # si tiene nodo izquierdo, tomamos su altura + 1
+        d = 0 if nodo.der == -1 else 1 + self.get_node(nodo.der).height # si tiene nodo derecho, tomamos su altura + 1
+        i = 0 if nodo.izq == -1 else 1 + self.get_node(nodo.izq).height # si tiene nodo izquierdo, tomamos su altura + 1
 
         return i - d
 
@@ -217,9 +474,9 @@ class AVL_db:
         y.izq = pos_x
         x.der = t2
         x.height = self.update_height(x)
-        self.patch(pos_y,y) # actualizamos la tupla en el archivo
-        y.height = self.update_height(y)
         self.patch(pos_x,x) # actualizamos la tupla en el archivo
+        y.height = self.update_height(y) # usa la altura de x ya actualizada
+        self.patch(pos_y,y) # actualizamos la tupla en el archivo
         return pos_y
 
     def balancear(self, punt:Venta, pos:int):
@@ -228,7 +485,7 @@ class AVL_db:
         balance = self.get_balance(punt)
 
         if balance > 1:
-            izq = self.get(punt.izq)
+            izq = self.get_node(punt.izq)
             # Caso 1
             if self.get_balance(izq) >= 0:
                 if pos == self.root:  # Si es la raíz, actualizamos la raíz
@@ -237,12 +494,13 @@ class AVL_db:
 
             # Caso 2
             else:
-                punt.izq = self.left_rotate(izq, punt.izq, self.get(izq.der),
+                punt.izq = self.left_rotate(izq, punt.izq, self.get_node(izq.der),
                                             izq.der)
-                return self.right_rotate(punt, pos, izq, punt.izq)
+                # el hijo izquierdo ahora es otro nodo, hay que leerlo de nuevo
+                return self.right_rotate(punt, pos, self.get_node(punt.izq), punt.izq)
 
         elif balance < -1:
-            der = self.get(punt.der)
+            der = self.get_node(punt.der)
             # Caso 1
             if self.get_balance(der) <= 0:
                 if pos == self.root:  # Si es la raíz, actualizamos la raíz
@@ -251,9 +509,10 @@ class AVL_db:
 
             # Caso 2
             else:
-                punt.der = self.right_rotate(der, punt.der, self.get(der.izq),
+                punt.der = self.right_rotate(der, punt.der, self.get_node(der.izq),
                                              der.izq)
-                return self.left_rotate(punt, pos, der, punt.der)
+                # el hijo derecho ahora es otro nodo, hay que leerlo de nuevo
+                return self.left_rotate(punt, pos, self.get_node(punt.der), punt.der)
 
         # else
         self.patch(pos, punt)
@@ -266,7 +525,7 @@ class AVL_db:
         """
         if pos == -1:
             return self.post(venta)
-        punt = self.get(pos)
+        punt = self.get_node(pos)
         if punt is None:
             return self.post(venta)
 
@@ -286,7 +545,13 @@ class AVL_db:
         if self.seek(record.id_venta, self.root) != -1:
             print("id repetido")
             return
-        self.addaux(record, self.root)
+        # la tupla puede venir de la bd: se inserta como hoja nueva y con su propio payload
+        record.der = record.izq = -1
+        record.height = 0
+        record.payload = -1
+        root = self.addaux(record, self.root)
+        if root != self.root: # hubo una rotacion en la raiz
+            self.put_header(root)
 
 
 
@@ -294,7 +559,16 @@ class AVL_db:
         """
         Busca una tupla en la base de datos
         """
-        return self.get(self.seek(id_venta, 0))
+        return self.get(self.seek(id_venta, self.root))
+
+    def read_many(self, ids:list)->list:
+        """
+        Busca varias tuplas, retorna una lista alineada con ids (None si no existe)
+        los payloads se leen juntos al final
+        """
+        r = [self.get_node(self.seek(id_venta, self.root)) for id_venta in ids]
+        self.load_payloads([t for t in r if t is not None])
+        return r
 
     def seek_aux(self, id_venta:int, pos:int, ant:int)->():
         """
@@ -302,7 +576,7 @@ class AVL_db:
         """
         if pos == -1:
             return ant,-1
-        punt = self.get(pos)
+        punt = self.get_node(pos)
         if punt is None:
             return ant,-1
         if id_venta == punt.id_venta:
@@ -317,8 +591,8 @@ class AVL_db:
         if pos == -1:
             print("no existe el elemento")
             return
-        punt = self.get(pos)
-        punt_ant = self.get(ant)
+        punt = self.get_node(pos)
+        punt_ant = self.get_node(ant)
         # caso 1
         if punt.der == -1 and punt.izq == -1:
             if not punt_ant: # si es la raiz
@@ -364,195 +638,201 @@ class AVL_db:
         else:
             # buscamos el sucesor
             pos_scsr = punt.der
-            scsr = self.get(pos_scsr)
+            scsr = self.get_node(pos_scsr)
             pos_ant_scsr = pos
             while scsr.izq != -1:
                 pos_ant_scsr = pos_scsr
                 pos_scsr = scsr.izq
-                scsr = self.get(pos_scsr)
+                scsr = self.get_node(pos_scsr)
 
             if pos_ant_scsr != pos: # si no es el sucesor directo
-                ant_scsr = self.get(pos_ant_scsr)
+                ant_scsr = self.get_node(pos_ant_scsr)
                 ant_scsr.izq = scsr.der
                 self.patch(pos_ant_scsr, ant_scsr)
             else:
                 punt.der = scsr.der
 
             punt.id_venta = scsr.id_venta
-            punt.nombre = scsr.nombre
-            punt.cant = scsr.cant
-            punt.precio_u = scsr.precio_u
-            punt.fecha = scsr.fecha
+            punt.payload = scsr.payload # el payload del sucesor pasa a este nodo
             self.patch(pos_scsr, Venta())
             self.patch(pos, punt)
 
-        return self.balancear(punt_ant, ant) if punt_ant else self.balancear(self.get(self.root), self.root)
+        return self.balancear(punt_ant, ant) if punt_ant else self.balancear(self.get_node(self.root), self.root)
 
-    def range_search(self, inf:int, sup:int):
+    def range_search(self, inf:int, sup:int, prefetch:bool = False):
         r = []
-        self.range_search_aux(self.root, inf, sup, r)
+        nodes = None
+        if prefetch:
+            # solo se leen los hijos que la busqueda visitaria
+            nodes = self.prefetch(self.root, lambda n: ((n.izq,) if inf < n.id_venta else ())
+                                                      + ((n.der,) if sup > n.id_venta else ()),
+                                  lambda n: inf <= n.id_venta <= sup)
+        self.range_search_aux(self.root, inf, sup, r, nodes)
         return r
 
-    def range_search_aux(self,pos:int, inf:int, sup:int, ret:list):
-        punt = self.get(pos)
+    def range_search_aux(self,pos:int, inf:int, sup:int, ret:list, nodes:dict = None):
+        punt = self.get(pos) if nodes is None else nodes.get(pos)
         if punt is None:
             return
         if inf <= punt.id_venta <= sup:
             ret.append(punt)
 
         if inf < punt.id_venta:
-            self.range_search_aux(punt.izq, inf, sup, ret)
+            self.range_search_aux(punt.izq, inf, sup, ret, nodes)
 
         if sup > punt.id_venta:
-            self.range_search_aux(punt.der, inf, sup, ret)
-
-
-
-ventas = [Venta(0, "Berenjena", 10, 2.5, "2025-15-10"), Venta(1, "Yucas", 30, 3.2, "2025-12-27"),
-          Venta(2, "Camotes", 20, 2.2, "2025-12-26"), Venta(3, "Choclo", 40, 4.2, "2025-12-28"),
-          Venta(4, "Papas", 10, 1.2, "2025-12-25"), Venta(5, "Arroz", 50, 5.2, "2025-12-29"),
-          Venta(6, "Maíz", 60, 3.8, "2025-12-30"), Venta(7, "Frijoles", 70, 6.5, "2025-12-31"),
-          Venta(8, "Lentejas", 80, 2.5, "2026-01-01"), Venta(9, "Tomates", 90, 1.9, "2026-01-02"),
-          Venta(10, "Cebollas", 100, 4.0, "2026-01-03")]
-
-import statistics
-
-# Listas para almacenar los tiempos
-tiempos_insercion = []
-tiempos_busqueda_901 = []
-tiempos_busqueda_302 = []
-tiempos_busqueda_106 = []
-tiempos_rango_2_300 = []
-tiempos_rango_253_793 = []
-tiempos_rango_83_924 = []
-tiempos_eliminacion_108 = []
-tiempos_eliminacion_302 = []
-tiempos_eliminacion_511 = []
-
-for _ in range(10):
-    b_ins = time.time()
-    bd = AVL_db('sales_dataset_random.csv')
-    e_ins = time.time()
-    tiempos_insercion.append(e_ins - b_ins)
-
-    b_bus1 = time.time()
-    venta901 = bd.read_record(901)
-    e1_bus1 = time.time()
-    tiempos_busqueda_901.append(e1_bus1 - b_bus1)
-
-    b_bus2 = time.time()
-    venta302 = bd.read_record(302)
-    e_bus2 = time.time()
-    tiempos_busqueda_302.append(e_bus2 - b_bus2)
-
-    b_bus3 = time.time()
-    venta106 = bd.read_record(106)
-    e_bus3 = time.time()
-    tiempos_busqueda_106.append(e_bus3 - b_bus3)
-
-    b_rng1 = time.time()
-    ventas = bd.range_search(2, 300)
-    e_rng1 = time.time()
-    tiempos_rango_2_300.append(e_rng1 - b_rng1)
-
-    b_rng2 = time.time()
-    ventas = bd.range_search(253, 793)
-    e_rng2 = time.time()
-    tiempos_rango_253_793.append(e_rng2 - b_rng2)
-
-    b_rng3 = time.time()
-    ventas = bd.range_search(83, 924)
-    e_rng3 = time.time()
-    tiempos_rango_83_924.append(e_rng3 - b_rng3)
-
-    b_del1 = time.time()
-    bd.delete_record(108)
-    e_del1 = time.time()
-    tiempos_eliminacion_108.append(e_del1 - b_del1)
-
-    b_del2 = time.time()
-    bd.delete_record(302)
-    e_del2 = time.time()
-    tiempos_eliminacion_302.append(e_del2 - b_del2)
-
-    b_del3 = time.time()
-    bd.delete_record(511)
-    e_del3 = time.time()
-    tiempos_eliminacion_511.append(e_del3 - b_del3)
-
-# Calcular promedios y desviaciones estándar
-print("RESULTADOS PROMEDIO Y DESVIACIÓN ESTÁNDAR:")
-print("Tiempo de inserción: Promedio =", statistics.mean(tiempos_insercion),
-      "Desviación estándar =", statistics.stdev(tiempos_insercion))
-print(tiempos_insercion)
-print("Tiempo de búsqueda 901: Promedio =", statistics.mean(tiempos_busqueda_901),
-      "Desviación estándar =", statistics.stdev(tiempos_busqueda_901))
-print(tiempos_busqueda_901)
-print("Tiempo de búsqueda 302: Promedio =", statistics.mean(tiempos_busqueda_302),
-      "Desviación estándar =", statistics.stdev(tiempos_busqueda_302))
-print(tiempos_busqueda_302)
-print("Tiempo de búsqueda 106: Promedio =", statistics.mean(tiempos_busqueda_106),
-      "Desviación estándar =", statistics.stdev(tiempos_busqueda_106))
-print(tiempos_busqueda_106)
-print("Tiempo de búsqueda rango 2-300: Promedio =", statistics.mean(tiempos_rango_2_300),
-      "Desviación estándar =", statistics.stdev(tiempos_rango_2_300))
-print(tiempos_rango_2_300)
-print("Tiempo de búsqueda rango 253-793: Promedio =", statistics.mean(tiempos_rango_253_793),
-      "Desviación estándar =", statistics.stdev(tiempos_rango_253_793))
-print(tiempos_rango_253_793)
-print("Tiempo de búsqueda rango 83-924: Promedio =", statistics.mean(tiempos_rango_83_924),
-      "Desviación estándar =", statistics.stdev(tiempos_rango_83_924))
-print(tiempos_rango_83_924)
-print("Tiempo de eliminación 108: Promedio =", statistics.mean(tiempos_eliminacion_108),
-      "Desviación estándar =", statistics.stdev(tiempos_eliminacion_108))
-print(tiempos_eliminacion_108)
-print("Tiempo de eliminación 302: Promedio =", statistics.mean(tiempos_eliminacion_302),
-      "Desviación estándar =", statistics.stdev(tiempos_eliminacion_302))
-print(tiempos_eliminacion_302)
-print("Tiempo de eliminación 511: Promedio =", statistics.mean(tiempos_eliminacion_511),
-      "Desviación estándar =", statistics.stdev(tiempos_eliminacion_511))
-print(tiempos_eliminacion_511)
-
-
-etiquetas = [
-    "Inserción",
-    "Búsqueda 901", "Búsqueda 302", "Búsqueda 106",
-    "Búsq. Rango 2-300", "Búsq. Rango 253-793", "Búsq. Rango 83-924",
-    "Elim. 108", "Elim. 302", "Elim. 511"
-]
-
-promedios = [
-    statistics.mean(tiempos_insercion),
-    statistics.mean(tiempos_busqueda_901), statistics.mean(tiempos_busqueda_302), statistics.mean(tiempos_busqueda_106),
-    statistics.mean(tiempos_rango_2_300), statistics.mean(tiempos_rango_253_793), statistics.mean(tiempos_rango_83_924),
-    statistics.mean(tiempos_eliminacion_108), statistics.mean(tiempos_eliminacion_302), statistics.mean(tiempos_eliminacion_511)
-]
-
-desviaciones = [
-    statistics.stdev(tiempos_insercion),
-    statistics.stdev(tiempos_busqueda_901), statistics.stdev(tiempos_busqueda_302), statistics.stdev(tiempos_busqueda_106),
-    statistics.stdev(tiempos_rango_2_300), statistics.stdev(tiempos_rango_253_793), statistics.stdev(tiempos_rango_83_924),
-    statistics.stdev(tiempos_eliminacion_108), statistics.stdev(tiempos_eliminacion_302), statistics.stdev(tiempos_eliminacion_511)
-]
-
-resultados = [
-    tiempos_insercion,
-    tiempos_busqueda_901, tiempos_busqueda_302, tiempos_busqueda_106,
-    tiempos_rango_2_300, tiempos_rango_253_793, tiempos_rango_83_924,
-    tiempos_eliminacion_108, tiempos_eliminacion_302, tiempos_eliminacion_511
-]
-
-# Crear gráficos
-fig, axs = plt.subplots(5, 2, figsize=(14, 20))
-axs = axs.flatten()
-
-for i, ax in enumerate(axs):
-    ax.errorbar(range(1, 11), resultados[i], yerr=desviaciones[i], fmt='o', color='blue', label='Tiempo')
-    ax.axhline(promedios[i], color='red', linestyle='--', label='Promedio')
-    ax.set_title(etiquetas[i])
-    ax.set_xlabel('Iteración')
-    ax.set_ylabel('Tiempo (s)')
-    ax.legend()
-
-plt.tight_layout()
-plt.show()
+            self.range_search_aux(punt.der, inf, sup, ret, nodes)
+
+
+
+# benchmark, solo al ejecutar el archivo directamente
+if __name__ == "__main__":
+    ventas = [Venta(0, "Berenjena", 10, 2.5, "2025-15-10"), Venta(1, "Yucas", 30, 3.2, "2025-12-27"),
+              Venta(2, "Camotes", 20, 2.2, "2025-12-26"), Venta(3, "Choclo", 40, 4.2, "2025-12-28"),
+              Venta(4, "Papas", 10, 1.2, "2025-12-25"), Venta(5, "Arroz", 50, 5.2, "2025-12-29"),
+              Venta(6, "Maíz", 60, 3.8, "2025-12-30"), Venta(7, "Frijoles", 70, 6.5, "2025-12-31"),
+              Venta(8, "Lentejas", 80, 2.5, "2026-01-01"), Venta(9, "Tomates", 90, 1.9, "2026-01-02"),
+              Venta(10, "Cebollas", 100, 4.0, "2026-01-03")]
+
+    import statistics
+    import matplotlib.pyplot as plt
+
+    # Listas para almacenar los tiempos
+    tiempos_insercion = []
+    tiempos_busqueda_901 = []
+    tiempos_busqueda_302 = []
+    tiempos_busqueda_106 = []
+    tiempos_rango_2_300 = []
+    tiempos_rango_253_793 = []
+    tiempos_rango_83_924 = []
+    tiempos_eliminacion_108 = []
+    tiempos_eliminacion_302 = []
+    tiempos_eliminacion_511 = []
+
+    for _ in range(10):
+        b_ins = time.time()
+        bd = AVL_db('sales_dataset_random.csv')
+        e_ins = time.time()
+        tiempos_insercion.append(e_ins - b_ins)
+
+        b_bus1 = time.time()
+        venta901 = bd.read_record(901)
+        e1_bus1 = time.time()
+        tiempos_busqueda_901.append(e1_bus1 - b_bus1)
+
+        b_bus2 = time.time()
+        venta302 = bd.read_record(302)
+        e_bus2 = time.time()
+        tiempos_busqueda_302.append(e_bus2 - b_bus2)
+
+        b_bus3 = time.time()
+        venta106 = bd.read_record(106)
+        e_bus3 = time.time()
+        tiempos_busqueda_106.append(e_bus3 - b_bus3)
+
+        b_rng1 = time.time()
+        ventas = bd.range_search(2, 300)
+        e_rng1 = time.time()
+        tiempos_rango_2_300.append(e_rng1 - b_rng1)
+
+        b_rng2 = time.time()
+        ventas = bd.range_search(253, 793)
+        e_rng2 = time.time()
+        tiempos_rango_253_793.append(e_rng2 - b_rng2)
+
+        b_rng3 = time.time()
+        ventas = bd.range_search(83, 924)
+        e_rng3 = time.time()
+        tiempos_rango_83_924.append(e_rng3 - b_rng3)
+
+        b_del1 = time.time()
+        bd.delete_record(108)
+        e_del1 = time.time()
+        tiempos_eliminacion_108.append(e_del1 - b_del1)
+
+        b_del2 = time.time()
+        bd.delete_record(302)
+        e_del2 = time.time()
+        tiempos_eliminacion_302.append(e_del2 - b_del2)
+
+        b_del3 = time.time()
+        bd.delete_record(511)
+        e_del3 = time.time()
+        tiempos_eliminacion_511.append(e_del3 - b_del3)
+
+    # Calcular promedios y desviaciones estándar
+    print("RESULTADOS PROMEDIO Y DESVIACIÓN ESTÁNDAR:")
+    print("Tiempo de inserción: Promedio =", statistics.mean(tiempos_insercion),
+          "Desviación estándar =", statistics.stdev(tiempos_insercion))
+    print(tiempos_insercion)
+    print("Tiempo de búsqueda 901: Promedio =", statistics.mean(tiempos_busqueda_901),
+          "Desviación estándar =", statistics.stdev(tiempos_busqueda_901))
+    print(tiempos_busqueda_901)
+    print("Tiempo de búsqueda 302: Promedio =", statistics.mean(tiempos_busqueda_302),
+          "Desviación estándar =", statistics.stdev(tiempos_busqueda_302))
+    print(tiempos_busqueda_302)
+    print("Tiempo de búsqueda 106: Promedio =", statistics.mean(tiempos_busqueda_106),
+          "Desviación estándar =", statistics.stdev(tiempos_busqueda_106))
+    print(tiempos_busqueda_106)
+    print("Tiempo de búsqueda rango 2-300: Promedio =", statistics.mean(tiempos_rango_2_300),
+          "Desviación estándar =", statistics.stdev(tiempos_rango_2_300))
+    print(tiempos_rango_2_300)
+    print("Tiempo de búsqueda rango 253-793: Promedio =", statistics.mean(tiempos_rango_253_793),
+          "Desviación estándar =", statistics.stdev(tiempos_rango_253_793))
+    print(tiempos_rango_253_793)
+    print("Tiempo de búsqueda rango 83-924: Promedio =", statistics.mean(tiempos_rango_83_924),
+          "Desviación estándar =", statistics.stdev(tiempos_rango_83_924))
+    print(tiempos_rango_83_924)
+    print("Tiempo de eliminación 108: Promedio =", statistics.mean(tiempos_eliminacion_108),
+          "Desviación estándar =", statistics.stdev(tiempos_eliminacion_108))
+    print(tiempos_eliminacion_108)
+    print("Tiempo de eliminación 302: Promedio =", statistics.mean(tiempos_eliminacion_302),
+          "Desviación estándar =", statistics.stdev(tiempos_eliminacion_302))
+    print(tiempos_eliminacion_302)
+    print("Tiempo de eliminación 511: Promedio =", statistics.mean(tiempos_eliminacion_511),
+          "Desviación estándar =", statistics.stdev(tiempos_eliminacion_511))
+    print(tiempos_eliminacion_511)
+
+
+    etiquetas = [
+        "Inserción",
+        "Búsqueda 901", "Búsqueda 302", "Búsqueda 106",
+        "Búsq. Rango 2-300", "Búsq. Rango 253-793", "Búsq. Rango 83-924",
+        "Elim. 108", "Elim. 302", "Elim. 511"
+    ]
+
+    promedios = [
+        statistics.mean(tiempos_insercion),
+        statistics.mean(tiempos_busqueda_901), statistics.mean(tiempos_busqueda_302), statistics.mean(tiempos_busqueda_106),
+        statistics.mean(tiempos_rango_2_300), statistics.mean(tiempos_rango_253_793), statistics.mean(tiempos_rango_83_924),
+        statistics.mean(tiempos_eliminacion_108), statistics.mean(tiempos_eliminacion_302), statistics.mean(tiempos_eliminacion_511)
+    ]
+
+    desviaciones = [
+        statistics.stdev(tiempos_insercion),
+        statistics.stdev(tiempos_busqueda_901), statistics.stdev(tiempos_busqueda_302), statistics.stdev(tiempos_busqueda_106),
+        statistics.stdev(tiempos_rango_2_300), statistics.stdev(tiempos_rango_253_793), statistics.stdev(tiempos_rango_83_924),
+        statistics.stdev(tiempos_eliminacion_108), statistics.stdev(tiempos_eliminacion_302), statistics.stdev(tiempos_eliminacion_511)
+    ]
+
+    resultados = [
+        tiempos_insercion,
+        tiempos_busqueda_901, tiempos_busqueda_302, tiempos_busqueda_106,
+        tiempos_rango_2_300, tiempos_rango_253_793, tiempos_rango_83_924,
+        tiempos_eliminacion_108, tiempos_eliminacion_302, tiempos_eliminacion_511
+    ]
+
+    # Crear gráficos
+    fig, axs = plt.subplots(5, 2, figsize=(14, 20))
+    axs = axs.flatten()
+
+    for i, ax in enumerate(axs):
+        ax.errorbar(range(1, 11), resultados[i], yerr=desviaciones[i], fmt='o', color='blue', label='Tiempo')
+        ax.axhline(promedios[i], color='red', linestyle='--', label='Promedio')
+        ax.set_title(etiquetas[i])
+        ax.set_xlabel('Iteración')
+        ax.set_ylabel('Tiempo (s)')
+        ax.legend()
+
+    plt.tight_layout()
+    plt.show()
@@ -0,0 +1,207 @@
+import itertools
+import queue
+import socket
+import threading
+
+from AVL import Venta, encode_varint
+from server import (READ_RECORD, READ_MANY, RANGE_SEARCH, ADD, DELETE_RECORD, OK, ID, RANGE,
+                    encode_record, decode_records, encode_str, read_message, pack_message)
+
+
+class ServerError(RuntimeError):
+    """
+    El servidor respondio ERROR a una operacion
+    """
+
+
+class PipelineError(RuntimeError):
+    """
+    Alguna operacion del pipeline fallo. results tiene el resultado de cada
+    operacion en el orden en que se encolaron, con un ServerError en el lugar
+    de las que fallaron; las demas si se ejecutaron en el servidor
+    """
+    def __init__(self, results: list):
+        self.results = results
+        self.errors = [r for r in results if isinstance(r, ServerError)]
+        super().__init__("; ".join(str(e) for e in self.errors))
+
+
+class Connection:
+    def __init__(self, address):
+        if isinstance(address, str):
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        else:
+            self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.sock.connect(address)
+        self.file = self.sock.makefile('rb')
+        self.ids = itertools.count()
+
+    def send(self, out: bytes, errors: list):
+        try:
+            self.sock.sendall(out)
+        except OSError as e:
+            errors.append(e)
+
+    def execute(self, requests: list) -> list:
+        """
+        Envia las peticiones y lee las respuestas en orden
+        requests: lista de (op, body)
+        Con varias peticiones el envio se hace desde otro hilo mientras se
+        leen las respuestas; si no, el servidor puede llenar el buffer del
+        socket con respuestas, dejar de leer, y ambos quedan bloqueados.
+        Una sola peticion se envia directo: el servidor la lee entera antes de responder
+        """
+        sent = []
+        out = bytearray()
+        for op, body in requests:
+            req_id = next(self.ids) & 0xffffffff
+            sent.append(req_id)
+            out += pack_message(req_id, op, body)
+
+        errors = []
+        writer = None
+        if len(requests) == 1:
+            self.sock.sendall(out)
+        else:
+            writer = threading.Thread(target=self.send, args=(out, errors), daemon=True)
+            writer.start()
+
+        r = []
+        for req_id in sent:
+            msg = read_message(self.file)
+            if msg is None:
+                raise ConnectionError("el servidor cerro la conexion")
+            resp_id, code, body = msg
+            if resp_id != req_id:
+                raise ConnectionError("respuesta fuera de orden")
+            r.append((code, body))
+        if writer is not None:
+            writer.join()
+        if errors:
+            raise errors[0]
+        return r
+
+    def close(self):
+        self.file.close()
+        self.sock.close()
+
+
+class Pipeline:
+    """
+    Acumula operaciones y las envia juntas por una sola conexion
+    """
+    def __init__(self, client):
+        self.client = client
+        self.requests = []
+        self.parsers = []
+
+    def queue(self, op: int, args: bytes, parser):
+        self.requests.append((op, encode_str(self.client.table) + args))
+        self.parsers.append(parser)
+        return self
+
+    def read_record(self, id_venta: int):
+        return self.queue(READ_RECORD, ID.pack(id_venta), lambda body: decode_records(body)[0])
+
+    def read_many(self, ids: list):
+        args = encode_varint(len(ids)) + b"".join(ID.pack(i) for i in ids)
+        return self.queue(READ_MANY, args, decode_records)
+
+    def range_search(self, inf: int, sup: int, prefetch: bool = False):
+        return self.queue(RANGE_SEARCH, RANGE.pack(inf, sup, prefetch), decode_records)
+
+    def add(self, record: Venta):
+        return self.queue(ADD, encode_record(record), lambda body: None)
+
+    def delete_record(self, id_venta: int):
+        return self.queue(DELETE_RECORD, ID.pack(id_venta), lambda body: None)
+
+    def execute(self) -> list:
+        """
+        Retorna los resultados en el mismo orden en que se encolaron
+        Si alguna operacion falla se lanza PipelineError con todos los resultados
+        """
+        requests, parsers = self.requests, self.parsers
+        self.requests, self.parsers = [], []
+        if not requests:
+            return []
+        responses = self.client.execute(requests)
+        r = [parser(body) if code == OK else ServerError(body.decode())
+             for (code, body), parser in zip(responses, parsers)]
+        if any(isinstance(x, ServerError) for x in r):
+            raise PipelineError(r)
+        return r
+
+
+class AVLClient:
+    """
+    Cliente de una tabla del servidor, con un pool de conexiones reutilizables
+    address: ruta de un socket unix, o (host, puerto)
+    """
+    def __init__(self, address, table: str, pool_size: int = 4):
+        self.address = address
+        self.table = table
+        self.pool = queue.LifoQueue(pool_size)
+
+    def acquire(self) -> Connection:
+        try:
+            return self.pool.get_nowait()
+        except queue.Empty:
+            return Connection(self.address)
+
+    def release(self, conn: Connection):
+        try:
+            self.pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def execute(self, requests: list) -> list:
+        conn = self.acquire()
+        try:
+            r = conn.execute(requests)
+        except Exception:
+            conn.close() # la conexion puede haber quedado a medio leer
+            raise
+        self.release(conn)
+        return r
+
+    def pipeline(self) -> Pipeline:
+        return Pipeline(self)
+
+    def execute_one(self, pipeline: Pipeline):
+        """
+        Ejecuta un pipeline de una sola operacion, lanzando su ServerError si falla
+        """
+        try:
+            return pipeline.execute()[0]
+        except PipelineError as e:
+            raise e.errors[0] from None
+
+    def close(self):
+        while True:
+            try:
+                self.pool.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def read_record(self, id_venta: int) -> Venta | None:
+        return self.execute_one(self.pipeline().read_record(id_venta))
+
+    def read_many(self, ids: list) -> list:
+        return self.execute_one(self.pipeline().read_many(ids))
+
+    def range_search(self, inf: int, sup: int, prefetch: bool = False) -> list:
+        return self.execute_one(self.pipeline().range_search(inf, sup, prefetch))
+
+    def add(self, record: Venta):
+        self.execute_one(self.pipeline().add(record))
+
+    def delete_record(self, id_venta: int):
+        self.execute_one(self.pipeline().delete_record(id_venta))
@@ -0,0 +1,187 @@
+import argparse
+import os
+import socketserver
+import struct
+import threading
+
+from AVL import AVL_db, Venta, encode_varint, decode_varint
+
+# cabecera de cada mensaje: longitud del cuerpo, id de la peticion, operacion (o estado)
+HEADER = struct.Struct('!IIB')
+
+READ_RECORD = 1
+READ_MANY = 2
+RANGE_SEARCH = 3
+ADD = 4
+DELETE_RECORD = 5
+
+OK = 0
+ERROR = 1
+
+ID = struct.Struct('!i')
+RANGE = struct.Struct('!ii?')
+
+
+def encode_record(venta: Venta | None) -> bytes:
+    """
+    Una tupla viaja como su entrada de indice (Venta.STRUCT) seguida del payload
+    None se envia como una tupla vacia (id_venta = -1)
+    """
+    if venta is None:
+        venta = Venta()
+    return venta.pack() + venta.pack_payload()
+
+def decode_record(data: bytes, i: int) -> (Venta | None, int):
+    venta = Venta()
+    venta.unpack(data[i:i + Venta.RECORD_SIZE])
+    i = venta.unpack_payload(data, i + Venta.RECORD_SIZE)
+    return (venta if venta.id_venta != -1 else None), i
+
+def encode_records(ventas: list) -> bytes:
+    return encode_varint(len(ventas)) + b"".join(encode_record(v) for v in ventas)
+
+def decode_records(data: bytes, i: int = 0) -> list:
+    n, i = decode_varint(data, i)
+    r = []
+    for _ in range(n):
+        venta, i = decode_record(data, i)
+        r.append(venta)
+    return r
+
+def encode_str(s: str) -> bytes:
+    raw = s.encode()
+    return encode_varint(len(raw)) + raw
+
+def decode_str(data: bytes, i: int) -> (str, int):
+    n, i = decode_varint(data, i)
+    return data[i:i + n].decode(), i + n
+
+def read_message(file) -> tuple | None:
+    """
+    Lee un mensaje completo de un archivo/socket, None si se cerro la conexion
+    """
+    header = file.read(HEADER.size)
+    if len(header) < HEADER.size:
+        return None
+    size, req_id, code = HEADER.unpack(header)
+    body = file.read(size)
+    if len(body) < size:
+        return None
+    return req_id, code, body
+
+def pack_message(req_id: int, code: int, body: bytes) -> bytes:
+    return HEADER.pack(len(body), req_id, code) + body
+
+
+class Handler(socketserver.StreamRequestHandler):
+    """
+    Atiende una conexion; las peticiones se responden en el orden en que
+    llegan, asi el cliente puede enviar varias sin esperar (pipelining)
+    """
+    def handle(self):
+        while True:
+            msg = read_message(self.rfile)
+            if msg is None:
+                return
+            req_id, op, body = msg
+            try:
+                code, out = OK, self.server.dispatch(op, body)
+            except Exception as e:
+                code, out = ERROR, str(e).encode()
+            self.wfile.write(pack_message(req_id, code, out))
+            self.wfile.flush()
+
+
+class AVLServerMixin:
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def setup_tables(self, tables: dict):
+        """
+        tables: nombre de la tabla -> archivo .dat (o .csv para cargarlo)
+        """
+        self.tables = {name: AVL_db(path) for name, path in tables.items()}
+        self.lock = threading.Lock() # AVL_db no es thread-safe
+
+    def server_close(self):
+        super().server_close()
+        for db in self.tables.values():
+            db.close()
+
+    def dispatch(self, op: int, body: bytes) -> bytes:
+        table, i = decode_str(body, 0)
+        if table not in self.tables:
+            raise ValueError(f"tabla desconocida: {table}")
+        db = self.tables[table]
+        with self.lock:
+            if op == READ_RECORD:
+                return encode_records([db.read_record(ID.unpack_from(body, i)[0])])
+            if op == READ_MANY:
+                n, i = decode_varint(body, i)
+                ids = [ID.unpack_from(body, i + k * ID.size)[0] for k in range(n)]
+                return encode_records(db.read_many(ids))
+            if op == RANGE_SEARCH:
+                inf, sup, prefetch = RANGE.unpack_from(body, i)
+                return encode_records(db.range_search(inf, sup, prefetch))
+            if op == ADD:
+                venta, _ = decode_record(body, i)
+                if venta is None:
+                    raise ValueError("id invalido: -1")
+                # del cliente solo se acepta la clave y el payload, la posicion en el arbol la decide el servidor
+                venta.der = venta.izq = -1
+                venta.height = 0
+                venta.payload = -1
+                if db.seek(venta.id_venta, db.root) != -1:
+                    raise ValueError(f"id repetido: {venta.id_venta}")
+                db.add(venta)
+                return b""
+            if op == DELETE_RECORD:
+                id_venta = ID.unpack_from(body, i)[0]
+                if db.seek(id_venta, db.root) == -1:
+                    raise ValueError(f"no existe el elemento: {id_venta}")
+                db.delete_record(id_venta)
+                return b""
+        raise ValueError(f"operacion desconocida: {op}")
+
+
+class AVLServer(AVLServerMixin, socketserver.ThreadingTCPServer):
+    def __init__(self, address: tuple, tables: dict):
+        self.setup_tables(tables)
+        super().__init__(address, Handler)
+
+
+if hasattr(socketserver, 'ThreadingUnixStreamServer'):
+    class AVLUnixServer(AVLServerMixin, socketserver.ThreadingUnixStreamServer):
+        def __init__(self, path: str, tables: dict):
+            self.setup_tables(tables)
+            if os.path.exists(path): # socket de una ejecucion anterior
+                os.remove(path)
+            super().__init__(path, Handler)
+
+
+def serve(address, tables: dict):
+    """
+    address: ruta de un socket unix, o (host, puerto)
+    """
+    if isinstance(address, str):
+        if not hasattr(socketserver, 'ThreadingUnixStreamServer'):
+            raise OSError("esta plataforma no tiene sockets unix, use (host, puerto)")
+        server = AVLUnixServer(address, tables)
+    else:
+        server = AVLServer(address, tables)
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Servidor de consultas para AVL_db")
+    parser.add_argument("tables", nargs="+", help="tablas como nombre=archivo.dat")
+    parser.add_argument("--unix", help="ruta del socket unix")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7733)
+    args = parser.parse_args()
+
+    tables = dict(t.split("=", 1) for t in args.tables)
+    server = serve(args.unix if args.unix else (args.host, args.port), tables)
+    print("escuchando en", server.server_address)
+    with server:
+        server.serve_forever()
@@ -0,0 +1,136 @@
+import struct
+
+import pytest
+
+from AVL import AVL_db, Venta, encode_varint, decode_varint, encode_fecha, decode_fecha
+
+
+def test_varint_roundtrip():
+    for n in (0, 1, 127, 128, 300, 2**31, 2**63):
+        data = encode_varint(n)
+        assert decode_varint(data) == (n, len(data))
+
+
+def test_fecha_roundtrip():
+    for fecha in ("2025-12-27", "2026-01-01", "2025-15-10", "", "27/12/2025"):
+        data = encode_fecha(fecha)
+        assert decode_fecha(data, 0) == (fecha, len(data))
+    assert len(encode_fecha("2025-12-27")) < len("2025-12-27") # se guarda como nro de dia
+
+
+def test_payload_roundtrip():
+    nombre = "Maíz morado de la sierra, variedad extra larga"
+    assert len(nombre.encode()) > 30
+    for cant in (0, 5, -3, 2**31 - 1, -2**31, 2**63, -2**63 - 1, 2**64, -2**64):
+        venta = Venta(7, nombre, cant, 3.75, "2025-15-10")
+        data = venta.pack_payload()
+        leida = Venta()
+        assert leida.unpack_payload(data) == len(data)
+        assert (leida.nombre, leida.cant, leida.precio_u, leida.fecha) == (nombre, cant, 3.75, "2025-15-10")
+
+
+def test_db_no_trunca_nombres(tmp_path):
+    db = AVL_db(str(tmp_path / "ventas.dat"))
+    nombre = "Maíz " * 20
+    db.add(Venta(0, nombre, 4, 1.5, "2025-12-26"))
+    db.add(Venta(1, "Papas", 2, 1.2, "2025-15-10"))
+    r = db.range_search(0, 1)
+    assert sorted((v.id_venta, v.nombre, v.fecha) for v in r) == [(0, nombre, "2025-12-26"),
+                                                                 (1, "Papas", "2025-15-10")]
+    assert len(AVL_db(str(tmp_path / "ventas.dat")).load_order()) == 2 # reabrir el archivo
+
+
+def test_rechaza_formato_anterior(tmp_path):
+    path = tmp_path / "viejo.dat"
+    viejo = struct.Struct('i30sif10siii')
+    path.write_bytes(struct.pack('i', 0) + viejo.pack(1, b"Papas", 2, 1.2, b"2025-12-25", -1, -1, 0))
+    with pytest.raises(ValueError):
+        AVL_db(str(path))
+
+
+def test_rechaza_heap_faltante(tmp_path):
+    path = tmp_path / "ventas.dat"
+    db = AVL_db(str(path))
+    db.add(Venta(0, "Papas", 2, 1.2, "2025-12-25"))
+    (tmp_path / "ventas.heap").unlink()
+    with pytest.raises(FileNotFoundError):
+        AVL_db(str(path))
+
+
+def test_prefetch_mismos_resultados(tmp_path):
+    import random
+    ids = list(range(300))
+    random.Random(1).shuffle(ids)
+    db = AVL_db(str(tmp_path / "ventas.dat"))
+    for i in ids:
+        # algunos nombres no entran en HEAP_READAHEAD y obligan a una segunda lectura
+        db.add(Venta(i, "Maíz" * (i % 40), i % 7 - 3, i / 10, "2025-12-%02d" % (1 + i % 28)))
+    db.delete_record(ids[10])
+    db.add(Venta(1000, "x" * 300, 1, 1.0, "2025-15-10"))
+
+    fila = lambda v: (v.id_venta, v.nombre, v.cant, v.precio_u, v.fecha, v.izq, v.der, v.height)
+    for inf, sup in [(0, 1000), (20, 150), (500, 510), (-5, -1), (1000, 1000)]:
+        assert [fila(v) for v in db.range_search(inf, sup, prefetch=True)] == \
+               [fila(v) for v in db.range_search(inf, sup)]
+    assert [fila(v) for v in db.load_order(prefetch=True)] == [fila(v) for v in db.load_order()]
+    db.close()
+
+
+def test_add_tupla_leida_de_la_bd(tmp_path):
+    db = AVL_db(str(tmp_path / "ventas.dat"))
+    db.add(Venta(1, "Papas", 2, 1.2, "2025-12-25"))
+    venta = db.read_record(1)
+    venta.id_venta = 2
+    venta.nombre = "Camotes"
+    venta.cant = 9
+    db.add(venta)
+    uno, dos = db.read_record(1), db.read_record(2)
+    assert (uno.nombre, uno.cant) == ("Papas", 2)
+    assert (dos.nombre, dos.cant) == ("Camotes", 9)
+    assert uno.payload != dos.payload
+
+
+def test_prefetch_con_un_solo_worker(tmp_path, monkeypatch):
+    import random
+    import threading
+    # las tareas del pool no deben esperar a otras tareas del mismo pool
+    monkeypatch.setattr(AVL_db, "PREFETCH_WORKERS", 1)
+    monkeypatch.setattr(AVL_db, "PREFETCH_GAP", 0)
+    ids = list(range(200))
+    random.Random(3).shuffle(ids)
+    db = AVL_db(str(tmp_path / "ventas.dat"))
+    for i in ids:
+        db.add(Venta(i, "Papas", 1, 1.0, "2025-12-01"))
+    esperado = [v.id_venta for v in db.range_search(0, 200)]
+
+    resultados = []
+    hilos = [threading.Thread(target=lambda: resultados.append(
+                 [v.id_venta for v in db.range_search(0, 200, prefetch=True)]), daemon=True)
+             for _ in range(4)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join(20)
+    assert resultados == [esperado] * 4
+    db.close()
+
+
+def test_insercion_mantiene_el_arbol(tmp_path):
+    import random
+    ids = list(range(500))
+    random.Random(0).shuffle(ids)
+    db = AVL_db(str(tmp_path / "ventas.dat"))
+    for i in ids:
+        db.add(Venta(i, "Papas", 1, 1.0, "2025-12-01"))
+    assert [v.id_venta for v in db.load_order()] == list(range(500))
+
+    def altura(pos):
+        nodo = db.get_node(pos)
+        if nodo is None:
+            return -1
+        izq, der = altura(nodo.izq), altura(nodo.der)
+        assert abs(izq - der) <= 1
+        assert nodo.height == max(izq, der) + 1
+        return nodo.height
+    assert altura(db.root) <= 10
+    assert all(db.read_record(i).id_venta == i for i in ids[:50])
@@ -0,0 +1,97 @@
+import os
+import socket
+import tempfile
+import threading
+import uuid
+
+import pytest
+
+from AVL import Venta
+from client import AVLClient, PipelineError, ServerError
+from server import serve
+
+
+@pytest.fixture
+def client(tmp_path):
+    if hasattr(socket, 'AF_UNIX'): # ruta corta, tmp_path puede pasar el limite de los sockets unix
+        address = os.path.join(tempfile.gettempdir(), "avl-%s.sock" % uuid.uuid4().hex[:8])
+    else:
+        address = ('127.0.0.1', 0)
+    server = serve(address, {'ventas': str(tmp_path / "ventas.dat")})
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    c = AVLClient(server.server_address, 'ventas')
+    for i in (5, 2, 8, 1, 9, 3):
+        c.add(Venta(i, "Maíz morado de la sierra %d" % i, i, i / 2, "2025-12-%02d" % i))
+    yield c
+    c.close()
+    server.shutdown()
+    server.server_close()
+    if isinstance(address, str):
+        os.remove(address)
+
+
+def test_roundtrip(client):
+    venta = client.read_record(8)
+    assert (venta.id_venta, venta.nombre, venta.cant, venta.precio_u, venta.fecha) == \
+           (8, "Maíz morado de la sierra 8", 8, 4.0, "2025-12-08")
+    assert client.read_record(100) is None
+    assert [v and v.id_venta for v in client.read_many([3, 100, 9])] == [3, None, 9]
+    assert sorted(v.id_venta for v in client.range_search(2, 8, prefetch=True)) == [2, 3, 5, 8]
+
+
+def test_pipeline(client):
+    p = client.pipeline()
+    p.add(Venta(7, "Papas", 1, 1.0, "2025-15-10")).read_record(7).delete_record(7).read_record(7)
+    _, venta, _, borrada = p.execute()
+    assert (venta.id_venta, venta.fecha) == (7, "2025-15-10")
+    assert borrada is None
+
+
+def test_errores(client):
+    with pytest.raises(ServerError, match="id repetido"):
+        client.add(Venta(5, "Papas", 1, 1.0, "2025-12-25"))
+    with pytest.raises(ServerError, match="no existe"):
+        client.delete_record(100)
+    with pytest.raises(ServerError, match="tabla desconocida"):
+        AVLClient(client.address, 'otra').read_record(1)
+    assert client.read_record(5).nombre == "Maíz morado de la sierra 5" # la conexion sigue usable
+
+
+def test_pipeline_con_error_en_medio(client):
+    p = client.pipeline()
+    p.add(Venta(20, "Papas", 1, 1.0, "2025-12-25"))
+    p.add(Venta(5, "Papas", 1, 1.0, "2025-12-25")) # repetido
+    p.delete_record(100) # no existe
+    p.add(Venta(21, "Yucas", 3, 3.2, "2025-12-27"))
+    p.read_many([20, 21])
+    with pytest.raises(PipelineError) as info:
+        p.execute()
+    agregado, repetido, faltante, agregado2, leidos = info.value.results
+    assert agregado is None and agregado2 is None
+    assert isinstance(repetido, ServerError) and "id repetido" in str(repetido)
+    assert isinstance(faltante, ServerError) and "no existe" in str(faltante)
+    assert info.value.errors == [repetido, faltante]
+    assert [v.id_venta for v in leidos] == [20, 21] # las operaciones correctas si se ejecutaron
+
+
+def test_add_ignora_punteros_del_cliente(client):
+    antes = client.range_search(0, 100)
+    esperado = sorted([v.id_venta for v in antes] + [50])
+    venta = max(antes, key=lambda v: v.height) # la raiz, con punteros a todo el arbol
+    venta.id_venta = 50
+    client.add(venta)
+    ids = [v.id_venta for v in client.range_search(0, 100)]
+    # con los punteros del cliente el nodo nuevo adoptaba un subarbol y aparecian filas repetidas
+    assert sorted(ids) == esperado
+
+
+def test_pipeline_grande_no_se_bloquea(client):
+    p = client.pipeline()
+    for _ in range(1000):
+        p.range_search(0, 100)
+    p.read_many(list(range(10)) * 10000)
+    r = []
+    hilo = threading.Thread(target=lambda: r.extend(p.execute()), daemon=True)
+    hilo.start()
+    hilo.join(30)
+    assert len(r) == 1001 and len(r[-1]) == 100000